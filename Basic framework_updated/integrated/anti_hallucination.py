@@ -13,18 +13,210 @@ Usage:
     
     validator = AntiHallucinationValidator()
     validated = validator.validate_results(facilities)
-    print(validator.generate_warning_report(validated))
+    summary = validator.summarize(validated)
+    print(validator.generate_warning_report(summary))
+    print(validator.add_disclaimer(summary))
+    
+    # JSON output needs the default= hook (see below)
+    json.dumps(validated, default=validation_json_default)
+
+Validation results:
+    facility['validation'] is a Validation object, not a dict. It is a
+    read-only Mapping, so validation['warnings'], .get(), 'key' in ...,
+    iteration, keys() / values() / items() and dict(validation) all work;
+    item assignment does not (set the attribute instead).
+    
+    Plain json.dumps() on validated facilities raises TypeError; pass
+    default=validation_json_default, or convert with Validation.to_dict().
 
 Requirements:
-    - pandas
+    - Python 3.10+ (Validation is a dataclass with slots=True)
     - numpy
     
 Note: This module works independently and has no absolute path dependencies.
+      It only needs NumPy and the standard library (no pandas import).
 """
 
-import pandas as pd
+import math
 import numpy as np
-from typing import Dict, List, Tuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Tuple, TypedDict, Union
+
+
+# Confidence and score thresholds as plain floats for the per-facility checks
+_HIGH_CONF, _MED_CONF, _LOW_CONF = 0.70, 0.50, 0.30
+_SCORE_HI, _SCORE_LO = 9.5, 2.0
+
+# Score cut-offs for estimating confidence when there is no similarity data
+_SCORE_CONF_HI, _SCORE_CONF_MED = 8.5, 7.0
+
+# Confidence levels by index, with their reliability weights
+_CONF_LEVELS = ('high', 'medium', 'low', 'unknown')
+_CONF_WEIGHT_VALUES = (1.0, 0.7, 0.4, 0.3)
+_CONF_WEIGHTS = np.array(_CONF_WEIGHT_VALUES)
+
+# Per-dimension facility keys (similarity and score for each of the five dimensions)
+_SIM_KEYS = (
+    'affordability_similarity', 'crisis_care_similarity', 'accessibility_similarity',
+    'specialization_similarity', 'community_integration_similarity'
+)
+_DIM_KEYS = (
+    'affordability_score', 'crisis_care_score', 'accessibility_score',
+    'specialization_score', 'community_integration_score'
+)
+
+# Fixed report/disclaimer text
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
+_DISCLAIMER_TEXT = (
+    "DISCLAIMER: This system provides reference information only,\n"
+    "            not medical advice. Actual services, costs, and\n"
+    "            availability should be confirmed directly with facilities."
+)
+_NO_FACILITIES_TEXT = "No facilities to validate."
+_EMPTY_DISCLAIMER = (
+    f"\nIMPORTANT NOTICE:\n{_THIN_RULE}\n"
+    f"{_NO_FACILITIES_TEXT}\n\n"
+    f"{_DISCLAIMER_TEXT}\n"
+    f"{_THIN_RULE}"
+)
+
+# Placeholder values that count as missing data (compared lower-cased)
+_INVALID_VALUES = frozenset({'', 'nan', 'address not available', 'phone not available'})
+
+
+def _is_valid_value(value) -> bool:
+    """Check that a facility field holds real data (not empty, NaN or a placeholder)"""
+    if not value:
+        return False
+    if isinstance(value, float):
+        return not math.isnan(value)
+    if isinstance(value, str):
+        return value.strip().lower() not in _INVALID_VALUES
+    return str(value).strip().lower() not in _INVALID_VALUES
+
+
+def _reliability(conf_weight, completeness):
+    """Comprehensive reliability before clamping (floats or NumPy arrays)"""
+    return (
+        conf_weight * 0.6 +     # Confidence weight 60%
+        completeness * 0.3 +    # Completeness weight 30%
+        0.1                     # Base score 10%
+    ) * 100
+
+
+def _masked_mean_std(values: np.ndarray,
+                     present: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-wise mean and std dev over the present entries of an (N, 5) array
+    
+    Matches np.mean / np.std on each facility's list of values (reduced in
+    float64): a present NaN propagates, missing entries are ignored.
+    
+    Args:
+        values: (N, 5) float64 values (0.0 where not present)
+        present: (N, 5) mask of entries the facility actually has
+    
+    Returns:
+        (mean, std) arrays of length N (0.0 for rows with nothing present)
+    """
+    
+    count = present.sum(axis=1)
+    nonempty = count > 0
+    
+    mean = np.divide(values.sum(axis=1), count,
+                     out=np.zeros(len(values)), where=nonempty)
+    sq_dev = np.where(present, (values - mean[:, None]) ** 2, 0.0)
+    std = np.sqrt(np.divide(sq_dev.sum(axis=1), count,
+                            out=np.zeros(len(values)), where=nonempty))
+    
+    return mean, std
+
+
+@dataclass(slots=True)
+class Validation(Mapping):
+    """
+    Validation information attached to a facility under 'validation'
+    
+    Replaces the old 4-key dict. As a read-only Mapping over its four
+    fields it still supports every dict-style read ([], get, in, iteration,
+    keys/values/items, len, dict()); writes go through attributes.
+    """
+    
+    confidence_level: str = 'unknown'
+    warnings: List[str] = field(default_factory=list)
+    data_source: str = 'unknown'
+    reliability_score: float = 0.0
+    
+    def to_dict(self) -> Dict:
+        """Convert to a plain dict (e.g. for JSON serialization)"""
+        return asdict(self)
+    
+    # Mapping interface (get, keys, items, values and 'in' come from Mapping)
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+
+def _get_validation(facility: Dict) -> Validation:
+    """
+    Read a facility's validation info
+    
+    Facilities that were never validated get a fresh empty Validation, and
+    an old dict-shaped entry is converted, so callers can use attributes.
+    """
+    
+    validation = facility.get('validation')
+    if validation is None:
+        return Validation()
+    if isinstance(validation, dict):
+        return Validation(
+            confidence_level=validation.get('confidence_level', 'unknown'),
+            warnings=list(validation.get('warnings', [])),
+            data_source=validation.get('data_source', 'unknown'),
+            reliability_score=validation.get('reliability_score', 0.0)
+        )
+    return validation
+
+
+def validation_json_default(obj):
+    """json.dumps(default=...) hook that serializes Validation objects"""
+    if isinstance(obj, Validation):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FacilityTD(TypedDict, total=False):
+    """Facility dict fields read or written by this module"""
+    
+    name: str
+    city: str
+    state: str
+    address: str
+    phone: str
+    zip: str
+    score: float
+    source: str
+    affordability_score: float
+    crisis_care_score: float
+    accessibility_score: float
+    specialization_score: float
+    community_integration_score: float
+    affordability_similarity: float
+    crisis_care_similarity: float
+    accessibility_similarity: float
+    specialization_similarity: float
+    community_integration_similarity: float
+    validation: Validation    # always set by validate_results()
+    badges: List[str]         # set by add_validation_badges()
 
 
 class AntiHallucinationValidator:
@@ -32,17 +224,28 @@ class AntiHallucinationValidator:
     
     # Confidence thresholds
     CONFIDENCE_THRESHOLDS = {
-        'high': 0.70,      # High confidence: similarity > 0.70
-        'medium': 0.50,    # Medium confidence: 0.50-0.70
-        'low': 0.30        # Low confidence: < 0.50
+        'high': _HIGH_CONF,    # High confidence: similarity > 0.70
+        'medium': _MED_CONF,   # Medium confidence: 0.50-0.70
+        'low': _LOW_CONF       # Low confidence: < 0.50
     }
     
     # Score reasonability thresholds
     SCORE_THRESHOLDS = {
-        'suspiciously_high': 9.5,  # Suspiciously high score
-        'suspiciously_low': 2.0    # Suspiciously low score
+        'suspiciously_high': _SCORE_HI,  # Suspiciously high score
+        'suspiciously_low': _SCORE_LO    # Suspiciously low score
     }
     
+    # Fields checked for data completeness
+    REQUIRED_FIELDS = ('name', 'city', 'state')
+    OPTIONAL_FIELDS = ('address', 'phone', 'zip')
+    NUM_REQUIRED_FIELDS = len(REQUIRED_FIELDS)
+    NUM_OPTIONAL_FIELDS = len(OPTIONAL_FIELDS)
+    
+    # Score anomaly warning templates
+    _MSG_HIGH = "Abnormally high score ({:.1f}/10), manual verification recommended"
+    _MSG_LOW = "Abnormally low score ({:.1f}/10), may not match criteria"
+    _MSG_VAR = "High score variance (std dev={:.1f}), may be unreliable"
+    
     def __init__(self):
         """Initialize validator"""
         self.validation_warnings = []
@@ -58,70 +261,87 @@ class AntiHallucinationValidator:
             facility dictionary with added validation information
         """
         
-        validation = {
-            'confidence_level': 'unknown',
-            'warnings': [],
-            'data_source': facility.get('source', 'unknown'),
-            'reliability_score': 0.0
-        }
+        # Scalar fast path: same rules as _validate_batch() (kept in step by
+        # validation_parity_test.py), without building (1, 5) arrays
+        score = facility.get('score', 0)
         
-        # 1. Check score confidence
-        confidence = self._check_score_confidence(facility)
-        validation['confidence_level'] = confidence
+        # 1. Score confidence (NaN averages land on 'low', as in the batch)
+        sims = [float(v) for v in map(facility.get, _SIM_KEYS) if v is not None]
+        if sims:
+            avg_similarity = sum(sims) / len(sims)
+            conf_idx = (0 if avg_similarity >= _HIGH_CONF
+                        else 1 if avg_similarity >= _MED_CONF else 2)
+        else:
+            conf_idx = (0 if score >= _SCORE_CONF_HI
+                        else 1 if score >= _SCORE_CONF_MED else 2)
         
         # 2. Check data completeness
         completeness = self._check_data_completeness(facility)
-        if completeness < 0.5:
-            validation['warnings'].append(
-                f"Incomplete data ({completeness*100:.0f}%)"
-            )
         
-        # 3. Check score anomalies
-        score_anomalies = self._check_score_anomalies(facility)
-        validation['warnings'].extend(score_anomalies)
+        # 3. Score anomalies
+        dims = [float(v) for v in map(facility.get, _DIM_KEYS) if v is not None]
+        std_dev = None
+        if dims:
+            dim_mean = sum(dims) / len(dims)
+            std_dev = math.sqrt(sum((d - dim_mean) * (d - dim_mean) for d in dims) / len(dims))
+            if not std_dev > 2.0:
+                std_dev = None
         
         # 4. Calculate reliability score
-        validation['reliability_score'] = self._calculate_reliability(
-            facility, confidence, completeness
-        )
+        reliability = min(100, max(0, _reliability(_CONF_WEIGHT_VALUES[conf_idx], completeness)))
         
-        # Add to facility information
+        validation = self._new_validation(facility, conf_idx, completeness, reliability)
+        validation.warnings.extend(self._score_anomaly_warnings(
+            score, score >= _SCORE_HI, score <= _SCORE_LO, std_dev
+        ))
         facility['validation'] = validation
         
         return facility
     
-    def _check_score_confidence(self, facility: Dict) -> str:
+    def _new_validation(self, facility: Dict, conf_idx: int,
+                        completeness: float, reliability: float) -> Validation:
+        """Validation with confidence, reliability and any completeness warning"""
+        
+        validation = Validation(
+            confidence_level=_CONF_LEVELS[conf_idx],
+            data_source=facility.get('source', 'unknown'),
+            reliability_score=float(reliability)
+        )
+        
+        if completeness < 0.5:
+            validation.warnings.append(
+                f"Incomplete data ({completeness*100:.0f}%)"
+            )
+        
+        return validation
+    
+    def _score_anomaly_warnings(self, overall_score: float, high: bool,
+                                low: bool, std_dev=None) -> List[str]:
         """
-        Check score confidence
-        Based on original similarity scores (if available)
+        Warning texts for score anomalies
+        
+        Args:
+            overall_score: facility score, as shown in the message
+            high / low: score at or beyond the suspicious thresholds
+            std_dev: dimension std dev if it exceeds the limit, else None
         """
         
-        # Try to get original similarities
-        similarities = []
-        for dim in ['affordability', 'crisis_care', 'accessibility', 
-                    'specialization', 'community_integration']:
-            sim_key = f'{dim}_similarity'
-            if sim_key in facility:
-                similarities.append(facility[sim_key])
-        
-        if not similarities:
-            # If no similarity data, estimate based on score range
-            score = facility.get('score', 0)
-            if score >= 8.5:
-                return 'high'
-            elif score >= 7.0:
-                return 'medium'
-            else:
-                return 'low'
-        
-        avg_similarity = np.mean(similarities)
-        
-        if avg_similarity >= self.CONFIDENCE_THRESHOLDS['high']:
-            return 'high'
-        elif avg_similarity >= self.CONFIDENCE_THRESHOLDS['medium']:
-            return 'medium'
-        else:
-            return 'low'
+        warnings = []
+        
+        if high:
+            warnings.append(
+                self._MSG_HIGH.format(overall_score)
+            )
+        if low:
+            warnings.append(
+                self._MSG_LOW.format(overall_score)
+            )
+        if std_dev is not None:
+            warnings.append(
+                self._MSG_VAR.format(std_dev)
+            )
+        
+        return warnings
     
     def _check_data_completeness(self, facility: Dict) -> float:
         """
@@ -131,214 +351,282 @@ class AntiHallucinationValidator:
             completeness score (0-1)
         """
         
-        required_fields = ['name', 'city', 'state']
-        optional_fields = ['address', 'phone', 'zip']
-        
         complete_required = sum(
-            1 for field in required_fields 
-            if facility.get(field) and str(facility[field]).strip() 
-            and str(facility[field]).lower() != 'nan'
+            1 for field in self.REQUIRED_FIELDS
+            if _is_valid_value(facility.get(field))
         )
         
-        complete_optional = 0
-        for field in optional_fields:
-            value = facility.get(field, '')
-            # Check if valid value (not empty, nan, or "not available")
-            if (value and str(value).strip() 
-                and str(value).lower() not in ['nan', 'address not available', 
-                                                 'phone not available', '']):
-                complete_optional += 1
+        # Check if valid value (not empty, nan, or "not available")
+        complete_optional = sum(
+            1 for field in self.OPTIONAL_FIELDS
+            if _is_valid_value(facility.get(field))
+        )
         
         # Required fields weight 80%, optional fields weight 20%
         completeness = (
-            (complete_required / len(required_fields)) * 0.8 +
-            (complete_optional / len(optional_fields)) * 0.2
+            (complete_required / self.NUM_REQUIRED_FIELDS) * 0.8 +
+            (complete_optional / self.NUM_OPTIONAL_FIELDS) * 0.2
         )
         
         return completeness
     
-    def _check_score_anomalies(self, facility: Dict) -> List[str]:
+    def validate_results(self, facilities: List[Dict]) -> List[Dict]:
         """
-        Check score anomalies
+        Validate all results
+        
+        Args:
+            facilities: list of facilities
         
         Returns:
-            list of warning messages
+            validated facility list (with warnings)
         """
         
-        warnings = []
+        if not facilities:
+            return []
         
-        overall_score = facility.get('score', 0)
-        
-        # Check suspiciously high scores
-        if overall_score >= self.SCORE_THRESHOLDS['suspiciously_high']:
-            warnings.append(
-                f"Abnormally high score ({overall_score:.1f}/10), manual verification recommended"
-            )
-        
-        # Check suspiciously low scores
-        if overall_score <= self.SCORE_THRESHOLDS['suspiciously_low']:
-            warnings.append(
-                f"Abnormally low score ({overall_score:.1f}/10), may not match criteria"
-            )
-        
-        # Check consistency across five dimensions
-        dimension_scores = []
-        for dim in ['affordability_score', 'crisis_care_score', 
-                    'accessibility_score', 'specialization_score', 
-                    'community_integration_score']:
-            if dim in facility:
-                dimension_scores.append(facility[dim])
-        
-        if dimension_scores:
-            std_dev = np.std(dimension_scores)
-            if std_dev > 2.0:
-                warnings.append(
-                    f"High score variance (std dev={std_dev:.1f}), may be unreliable"
-                )
-        
-        return warnings
+        return self._validate_batch(facilities)
     
-    def _calculate_reliability(self, facility: Dict, 
-                               confidence: str, 
-                               completeness: float) -> float:
+    def _validate_batch(self, facilities: List[Dict]) -> List[Dict]:
         """
-        Calculate reliability score
+        Validate a list of facilities in one vectorized pass
+        
+        Similarities and dimension scores are gathered into (N, 5) arrays
+        with a separate presence mask (missing keys and None are not
+        present; a NaN value is, and propagates like it does in np.mean),
+        so confidence levels and score variance are computed with a
+        handful of NumPy calls instead of per-facility np.mean / np.std
+        on tiny lists. validate_facility() applies the same rules to a
+        single facility without building arrays.
+        
+        Args:
+            facilities: list of facilities
         
         Returns:
-            reliability score (0-100)
+            validated facility list (with warnings)
         """
         
-        # Confidence weights
-        confidence_weights = {
-            'high': 1.0,
-            'medium': 0.7,
-            'low': 0.4,
-            'unknown': 0.3
-        }
+        n = len(facilities)
+        
+        # Struct-of-Arrays layout: collect plain lists in a single pass and
+        # convert once (float64 throughout; float32 inputs are promoted)
+        sim_values, sim_mask, dim_values, dim_mask = [], [], [], []
+        for facility in facilities:
+            for key in _SIM_KEYS:
+                value = facility.get(key)
+                sim_mask.append(value is not None)
+                sim_values.append(0.0 if value is None else value)
+            for key in _DIM_KEYS:
+                value = facility.get(key)
+                dim_mask.append(value is not None)
+                dim_values.append(0.0 if value is None else value)
+        
+        sims = np.array(sim_values, dtype=np.float64).reshape(n, len(_SIM_KEYS))
+        sim_present = np.array(sim_mask).reshape(sims.shape)
+        dim_scores = np.array(dim_values, dtype=np.float64).reshape(n, len(_DIM_KEYS))
+        dim_present = np.array(dim_mask).reshape(dim_scores.shape)
+        scores = np.array([f.get('score', 0) for f in facilities], dtype=np.float64)
+        
+        # 1. Score confidence: 0 = high, 1 = medium, 2 = low
+        # (NaN averages fail both comparisons and land on 'low')
+        avg_similarity, _ = _masked_mean_std(sims, sim_present)
+        conf_from_sim = np.where(
+            avg_similarity >= _HIGH_CONF, 0,
+            np.where(avg_similarity >= _MED_CONF, 1, 2)
+        )
+        # If no similarity data, estimate based on score range
+        conf_from_score = np.where(
+            scores >= _SCORE_CONF_HI, 0,
+            np.where(scores >= _SCORE_CONF_MED, 1, 2)
+        )
+        conf_idx = np.where(sim_present.any(axis=1), conf_from_sim, conf_from_score)
         
-        confidence_score = confidence_weights.get(confidence, 0.3)
+        # 3. Score anomalies
+        high_mask = scores >= _SCORE_HI
+        low_mask = scores <= _SCORE_LO
         
-        # Comprehensive reliability
-        reliability = (
-            confidence_score * 0.6 +    # Confidence weight 60%
-            completeness * 0.3 +         # Completeness weight 30%
-            0.1                          # Base score 10%
-        ) * 100
+        # (a NaN std dev never exceeds the limit)
+        _, std_dev = _masked_mean_std(dim_scores, dim_present)
+        var_mask = dim_present.any(axis=1) & (std_dev > 2.0)
+        
+        # 2. Check data completeness
+        completeness = [self._check_data_completeness(f) for f in facilities]
         
-        return min(100, max(0, reliability))
+        # 4. Calculate reliability score
+        reliability = np.clip(
+            _reliability(_CONF_WEIGHTS[conf_idx], np.array(completeness)), 0, 100
+        )
+        
+        # Zip results back into each facility dict
+        validations = []
+        for facility, idx, comp, rel in zip(facilities, conf_idx.tolist(),
+                                            completeness, reliability.tolist()):
+            validation = self._new_validation(facility, idx, comp, rel)
+            facility['validation'] = validation
+            validations.append(validation)
+        
+        # Warning strings are only built for facilities flagged by a mask
+        for row in np.nonzero(high_mask | low_mask | var_mask)[0].tolist():
+            validations[row].warnings.extend(self._score_anomaly_warnings(
+                facilities[row].get('score', 0), high_mask[row], low_mask[row],
+                float(std_dev[row]) if var_mask[row] else None
+            ))
+        
+        return list(facilities)
     
-    def validate_results(self, facilities: List[Dict]) -> List[Dict]:
+    def summarize(self, facilities: List[Dict]) -> Dict:
         """
-        Validate all results
+        Collect validation statistics in a single pass
+        
+        The result can be passed to both generate_warning_report() and
+        add_disclaimer() so the list is only scanned once.
         
         Args:
-            facilities: list of facilities
+            facilities: list of validated facilities
         
         Returns:
-            validated facility list (with warnings)
+            dict with 'total', 'counts' (high/medium/low),
+            'avg_reliability' and 'with_warnings'
         """
         
-        validated = []
-        
-        for facility in facilities:
-            validated_facility = self.validate_facility(facility)
-            validated.append(validated_facility)
-        
-        return validated
+        counts = {'high': 0, 'medium': 0, 'low': 0}
+        with_warnings = []
+        reliability_sum = 0
+        
+        for f in facilities:
+            validation = _get_validation(f)
+            level = validation.confidence_level
+            if level in counts:
+                counts[level] += 1
+            if validation.warnings:
+                with_warnings.append(f)
+            reliability_sum += validation.reliability_score
+        
+        return {
+            'total': len(facilities),
+            'counts': counts,
+            'avg_reliability': reliability_sum / max(1, len(facilities)),
+            'with_warnings': with_warnings
+        }
     
-    def generate_warning_report(self, facilities: List[Dict]) -> str:
+    def generate_warning_report(self, summary: Union[Dict, List[Dict]]) -> str:
         """
         Generate warning report
         
+        Args:
+            summary: either the dict returned by summarize(), or a list of
+                     validated facilities (the original signature), which
+                     is summarized first
+        
         Returns:
             warning report text
         """
         
-        report_lines = []
-        
-        report_lines.append("="*70)
-        report_lines.append("WARNING: VALIDATION REPORT")
-        report_lines.append("="*70)
-        
-        total = len(facilities)
-        high_confidence = sum(
-            1 for f in facilities 
-            if f.get('validation', {}).get('confidence_level') == 'high'
-        )
-        medium_confidence = sum(
-            1 for f in facilities 
-            if f.get('validation', {}).get('confidence_level') == 'medium'
+        # A facility list (not a summarize() dict) is summarized here
+        if not isinstance(summary, dict):
+            summary = self.summarize(summary)
+        
+        # Nothing to report (also avoids dividing by a zero total)
+        if not summary['total']:
+            return _NO_FACILITIES_TEXT
+        
+        total = summary['total']
+        high_confidence = summary['counts']['high']
+        medium_confidence = summary['counts']['medium']
+        low_confidence = summary['counts']['low']
+        facilities_with_warnings = summary['with_warnings']
+        
+        header = (
+            f"{_RULE}\nWARNING: VALIDATION REPORT\n{_RULE}\n"
+            f"\nTotal Facilities: {total}\n"
+            f"High Confidence: {high_confidence} ({high_confidence/total*100:.0f}%)\n"
+            f"Medium Confidence: {medium_confidence} ({medium_confidence/total*100:.0f}%)\n"
+            f"Low Confidence: {low_confidence} ({low_confidence/total*100:.0f}%)"
         )
-        low_confidence = sum(
-            1 for f in facilities 
-            if f.get('validation', {}).get('confidence_level') == 'low'
-        )
-        
-        report_lines.append(f"\nTotal Facilities: {total}")
-        report_lines.append(f"High Confidence: {high_confidence} ({high_confidence/total*100:.0f}%)")
-        report_lines.append(f"Medium Confidence: {medium_confidence} ({medium_confidence/total*100:.0f}%)")
-        report_lines.append(f"Low Confidence: {low_confidence} ({low_confidence/total*100:.0f}%)")
-        
-        # Display specific warnings
-        facilities_with_warnings = [
-            f for f in facilities 
-            if f.get('validation', {}).get('warnings')
-        ]
         
+        # Display specific warnings (only this part varies in length)
         if facilities_with_warnings:
-            report_lines.append(f"\nWARNING: {len(facilities_with_warnings)} facilities have warnings:")
+            lines = [f"\nWARNING: {len(facilities_with_warnings)} facilities have warnings:"]
             for i, facility in enumerate(facilities_with_warnings, 1):
-                report_lines.append(f"\n{i}. {facility['name']}")
-                for warning in facility['validation']['warnings']:
-                    report_lines.append(f"   - {warning}")
+                lines.append(f"\n\n{i}. {facility['name']}")
+                for warning in _get_validation(facility).warnings:
+                    lines.append(f"\n   - {warning}")
+            body = "".join(lines)
         else:
-            report_lines.append("\n✓ All facilities passed validation")
+            body = "\n✓ All facilities passed validation"
         
-        report_lines.append("\n" + "="*70)
-        
-        return "\n".join(report_lines)
+        return f"{header}\n{body}\n\n{_RULE}"
     
-    def add_disclaimer(self, facilities: List[Dict]) -> str:
+    def add_disclaimer(self, summary: Union[Dict, List[Dict]]) -> str:
         """
         Generate disclaimer
         
+        Args:
+            summary: either the dict returned by summarize(), or a list of
+                     validated facilities (the original signature), which
+                     is summarized first
+        
         Returns:
             disclaimer text
         """
         
-        avg_reliability = np.mean([
-            f.get('validation', {}).get('reliability_score', 0)
-            for f in facilities
-        ])
+        # A facility list (not a summarize() dict) is summarized here
+        if not isinstance(summary, dict):
+            summary = self.summarize(summary)
         
-        disclaimer = []
+        if not summary['total']:
+            return _EMPTY_DISCLAIMER
         
-        disclaimer.append("\nIMPORTANT NOTICE:")
-        disclaimer.append("-"*70)
+        avg_reliability = summary['avg_reliability']
         
         if avg_reliability >= 70:
-            disclaimer.append("✓ Results based on multi-source evaluation, high reliability")
+            status = "✓ Results based on multi-source evaluation, high reliability"
         elif avg_reliability >= 50:
-            disclaimer.append("WARNING: Results based on limited data, phone verification recommended")
+            status = "WARNING: Results based on limited data, phone verification recommended"
         else:
-            disclaimer.append("CAUTION: Low confidence results, manual verification strongly recommended")
-        
-        disclaimer.append("")
-        disclaimer.append("DISCLAIMER: This system provides reference information only,")
-        disclaimer.append("            not medical advice. Actual services, costs, and")
-        disclaimer.append("            availability should be confirmed directly with facilities.")
-        disclaimer.append("")
-        disclaimer.append(f"Average Reliability: {avg_reliability:.0f}/100")
-        disclaimer.append("-"*70)
-        
-        return "\n".join(disclaimer)
+            status = "CAUTION: Low confidence results, manual verification strongly recommended"
+        
+        return (
+            f"\nIMPORTANT NOTICE:\n{_THIN_RULE}\n"
+            f"{status}\n\n"
+            f"{_DISCLAIMER_TEXT}\n\n"
+            f"Average Reliability: {avg_reliability:.0f}/100\n"
+            f"{_THIN_RULE}"
+        )
 
 
 # =====================================================
 # Integration Functions for Main System
 # =====================================================
 
-def validate_and_display_with_warnings(facilities: List[Dict]):
+# Shared by the helpers below so they don't each build their own validator
+_SHARED_VALIDATOR = AntiHallucinationValidator()
+
+
+def ensure_validated(facilities: List[FacilityTD]) -> List[FacilityTD]:
+    """
+    Validate facilities only if they have not been validated yet
+    
+    The 'validation' key added by validate_results() acts as the cache
+    key: only facilities without it are validated (in place), so calling
+    several helpers in a row validates each facility once, and a mix of
+    cached and fresh rows is still fully validated. Every facility in
+    the returned list has a 'validation' entry; read it with
+    _get_validation() so older dict-shaped entries also work.
+    
+    Args:
+        facilities: list of facilities
+    
+    Returns:
+        validated facility list
+    """
+    
+    pending = [f for f in facilities if 'validation' not in f]
+    if pending:
+        _SHARED_VALIDATOR.validate_results(pending)
+    return facilities
+
+
+def validate_and_display_with_warnings(facilities: List[FacilityTD]):
     """
     Validate and display results (with warnings)
     
@@ -349,11 +637,10 @@ def validate_and_display_with_warnings(facilities: List[Dict]):
         print("ERROR: No facilities found")
         return
     
-    # Create validator
-    validator = AntiHallucinationValidator()
+    validator = _SHARED_VALIDATOR
     
-    # Validate all facilities
-    validated_facilities = validator.validate_results(facilities)
+    # Validate all facilities (skipped if already validated)
+    validated_facilities = ensure_validated(facilities)
     
     # Display results (with validation information)
     print("\n" + "="*70)
@@ -361,10 +648,10 @@ def validate_and_display_with_warnings(facilities: List[Dict]):
     print("="*70)
     
     for i, facility in enumerate(validated_facilities, 1):
-        validation = facility.get('validation', {})
+        validation = _get_validation(facility)
         
         # Reliability indicator
-        reliability = validation.get('reliability_score', 0)
+        reliability = validation.reliability_score
         if reliability >= 70:
             reliability_icon = "🟢"  # Green
         elif reliability >= 50:
@@ -377,7 +664,7 @@ def validate_and_display_with_warnings(facilities: List[Dict]):
         print(f"   Reliability: {reliability:.0f}/100")
         
         # Display warnings
-        warnings = validation.get('warnings', [])
+        warnings = validation.warnings
         if warnings:
             print(f"   WARNING:")
             for warning in warnings:
@@ -385,16 +672,19 @@ def validate_and_display_with_warnings(facilities: List[Dict]):
         
         print(f"   Location: {facility['city']}, {facility['state']}")
         print(f"   Phone: {facility['phone']}")
-        print(f"   Data Source: {validation.get('data_source', 'unknown')}")
+        print(f"   Data Source: {validation.data_source}")
+    
+    # Summarize once for both the report and the disclaimer
+    summary = validator.summarize(validated_facilities)
     
     # Display warning report
-    print(validator.generate_warning_report(validated_facilities))
+    print(validator.generate_warning_report(summary))
     
     # Display disclaimer
-    print(validator.add_disclaimer(validated_facilities))
+    print(validator.add_disclaimer(summary))
 
 
-def get_high_confidence_facilities(facilities: List[Dict]) -> List[Dict]:
+def get_high_confidence_facilities(facilities: List[FacilityTD]) -> List[FacilityTD]:
     """
     Filter for high-confidence facilities only
     
@@ -405,18 +695,17 @@ def get_high_confidence_facilities(facilities: List[Dict]) -> List[Dict]:
         list of high-confidence facilities
     """
     
-    validator = AntiHallucinationValidator()
-    validated = validator.validate_results(facilities)
+    validated = ensure_validated(facilities)
     
     high_confidence = [
         f for f in validated
-        if f.get('validation', {}).get('confidence_level') == 'high'
+        if _get_validation(f).confidence_level == 'high'
     ]
     
     return high_confidence
 
 
-def add_validation_badges(facilities: List[Dict]) -> List[Dict]:
+def add_validation_badges(facilities: List[FacilityTD]) -> List[FacilityTD]:
     """
     Add validation badges to facilities for display
     
@@ -427,13 +716,12 @@ def add_validation_badges(facilities: List[Dict]) -> List[Dict]:
         facilities with badge information added
     """
     
-    validator = AntiHallucinationValidator()
-    validated = validator.validate_results(facilities)
+    validated = ensure_validated(facilities)
     
     for facility in validated:
-        validation = facility.get('validation', {})
-        reliability = validation.get('reliability_score', 0)
-        confidence = validation.get('confidence_level', 'unknown')
+        validation = _get_validation(facility)
+        reliability = validation.reliability_score
+        confidence = validation.confidence_level
         
         # Create badge text
         badges = []
@@ -444,7 +732,7 @@ def add_validation_badges(facilities: List[Dict]) -> List[Dict]:
         if confidence == 'high':
             badges.append("HIGH CONFIDENCE")
         
-        if not validation.get('warnings'):
+        if not validation.warnings:
             badges.append("NO WARNINGS")
         
         facility['badges'] = badges
@@ -409,16 +409,17 @@ class Group3MainWorkflow:
             
             validator = AntiHallucinationValidator()
             validated_facilities = validator.validate_results(facilities)
+            summary = validator.summarize(validated_facilities)
             
             # Display validation report
-            print(validator.generate_warning_report(validated_facilities))
+            print(validator.generate_warning_report(summary))
             print()
             
             # Display results
             display_results(validated_facilities, location, insurance)
             
             # Display disclaimer
-            print(validator.add_disclaimer(validated_facilities))
+            print(validator.add_disclaimer(summary))
             
         except ImportError:
             # If no anti-hallucination module, still display results with basic warning
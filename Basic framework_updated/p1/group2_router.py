@@ -5,21 +5,23 @@ Maps 57 subcategories to corresponding processing branches
 Includes Om's Care Level Logic for confidence-based decision making
 """
 
+import functools
+
 # =====================================================
 # Care Level Definitions (Om's Logic)
 # =====================================================
 
 # Urgent categories - always continue even with low confidence
-URGENT_CATEGORIES = {
+URGENT_CATEGORIES = frozenset({
     'Crisis counseling',
     'Crisis line',
     'Crisis services',
     'IPV support services',
     'Trauma counseling',
-}
+})
 
 # Moderate categories - continue if confidence >= 30%
-MODERATE_CATEGORIES = {
+MODERATE_CATEGORIES = frozenset({
     'Mental health',
     'Mental health support',
     'Counseling',
@@ -40,13 +42,13 @@ MODERATE_CATEGORIES = {
     'Specialist',
     'Parenting support',
     'Case management',
-}
+})
 
 # Low priority categories - stop if confidence < 50%
-LOW_PRIORITY_CATEGORIES = {
+LOW_PRIORITY_CATEGORIES = frozenset({
     'Self-care',
     'Self-help',
-}
+})
 
 
 # =====================================================
@@ -54,7 +56,7 @@ LOW_PRIORITY_CATEGORIES = {
 # =====================================================
 
 # Group 3 Processing: Affordable Care (requires mental health facility recommendations)
-GROUP3_CATEGORIES = {
+GROUP3_CATEGORIES = frozenset({
     # Core mental health services
     'Mental health',
     'Mental health support',
@@ -98,10 +100,10 @@ GROUP3_CATEGORIES = {
     'Specialist',
     'Parenting support',
     'Case management',
-}
+})
 
 # Group 4 Processing: Local Events (support groups, community activities)
-GROUP4_CATEGORIES = {
+GROUP4_CATEGORIES = frozenset({
     # Support groups
     'Support group',
     
@@ -113,10 +115,10 @@ GROUP4_CATEGORIES = {
     
     # LGBTQ+ resources (if in community activity format)
     'LGBTQ+ resource',
-}
+})
 
 # Other Categories: Not within scope of Group 3 or 4
-OTHER_CATEGORIES = {
+OTHER_CATEGORIES = frozenset({
     # Academic-related
     'Academic advising',
     'Academic coaching',
@@ -158,8 +160,50 @@ OTHER_CATEGORIES = {
     'IPV support services',
     'Military student support',
     'Case manager',
+})
+
+
+# =====================================================
+# Lookup Tables (built once at import)
+# =====================================================
+
+# Per-branch (branch, action, message template)
+_BRANCH_ROUTES = (
+    (GROUP3_CATEGORIES, 'group3', 'proceed_to_group3',
+     'Based on your category [{}], this is within Affordable Care services. Proceeding to Group 3 process.'),
+    (GROUP4_CATEGORIES, 'group4', 'transfer_to_group4',
+     'Based on your category [{}], this is within Local Events services. Transferring to Group 4 process.'),
+    (OTHER_CATEGORIES, 'other', 'return_to_previous_step',
+     'Based on your category [{}], this is currently out of scope. Please return to the previous step and try again.'),
+)
+
+_UNKNOWN_ROUTE = (
+    'unknown', 'ask_for_clarification',
+    'Sorry, unable to recognize category [{}]. Please rephrase your needs.'
+)
+
+# Category -> (branch, action, message); messages depend only on the
+# category, so they are formatted here once (the category sets are disjoint)
+_ROUTE_TABLE = {
+    category: (branch, action, template.format(category))
+    for categories, branch, action, template in _BRANCH_ROUTES
+    for category in categories
 }
 
+# Category -> lower-cased name used in user-facing messages
+_CATEGORY_LOWER = {
+    c: c.lower()
+    for c in (GROUP3_CATEGORIES | GROUP4_CATEGORIES | OTHER_CATEGORIES
+              | URGENT_CATEGORIES | MODERATE_CATEGORIES | LOW_PRIORITY_CATEGORIES)
+}
+
+# Category -> care level (Om's Logic)
+_CARE_MAP = (
+    {c: 'URGENT' for c in URGENT_CATEGORIES}
+    | {c: 'MODERATE' for c in MODERATE_CATEGORIES}
+    | {c: 'LOW' for c in LOW_PRIORITY_CATEGORIES}
+)
+
 
 # =====================================================
 # Routing Functions
@@ -178,45 +222,29 @@ def route_category(category, confidence=None):
     """
     
     # Normalize category name (remove extra spaces)
-    category = category.strip()
+    return _route_stripped_category(category.strip(), confidence)
+
+
+def _route_stripped_category(category, confidence):
+    """route_category() for a category that has already been stripped"""
     
     # Determine which branch
-    if category in GROUP3_CATEGORIES:
-        return {
-            'branch': 'group3',
-            'message': f'Based on your category [{category}], this is within Affordable Care services. Proceeding to Group 3 process.',
-            'category': category,
-            'confidence': confidence,
-            'action': 'proceed_to_group3'
-        }
-    
-    elif category in GROUP4_CATEGORIES:
-        return {
-            'branch': 'group4',
-            'message': f'Based on your category [{category}], this is within Local Events services. Transferring to Group 4 process.',
-            'category': category,
-            'confidence': confidence,
-            'action': 'transfer_to_group4'
-        }
+    entry = _ROUTE_TABLE.get(category)
     
-    elif category in OTHER_CATEGORIES:
-        return {
-            'branch': 'other',
-            'message': f'Based on your category [{category}], this is currently out of scope. Please return to the previous step and try again.',
-            'category': category,
-            'confidence': confidence,
-            'action': 'return_to_previous_step'
-        }
-    
-    else:
+    if entry is None:
         # Unknown category
-        return {
-            'branch': 'unknown',
-            'message': f'Sorry, unable to recognize category [{category}]. Please rephrase your needs.',
-            'category': category,
-            'confidence': confidence,
-            'action': 'ask_for_clarification'
-        }
+        branch, action, template = _UNKNOWN_ROUTE
+        message = template.format(category)
+    else:
+        branch, action, message = entry
+    
+    return {
+        'branch': branch,
+        'message': message,
+        'category': category,
+        'confidence': confidence,
+        'action': action
+    }
 
 
 def process_group2_output(group2_result):
@@ -230,10 +258,17 @@ def process_group2_output(group2_result):
         dict: routing decision result
     """
     
-    category = group2_result.get('category', '')
+    category = group2_result.get('category', '').strip()
     confidence = group2_result.get('confidence', None)
     
-    routing_decision = route_category(category, confidence)
+    routing_decision = _route_stripped_category(category, confidence)
+    _add_input_and_warning(routing_decision, group2_result, confidence)
+    
+    return routing_decision
+
+
+def _add_input_and_warning(routing_decision, group2_result, confidence):
+    """Add original input and low-confidence warning to a routing decision"""
     
     # Add original input information
     if 'user_input' in group2_result:
@@ -242,8 +277,60 @@ def process_group2_output(group2_result):
     # Warn if confidence is too low
     if confidence and confidence < 0.5:
         routing_decision['warning'] = f'WARNING: Classification confidence is low ({confidence:.2%}), result may be inaccurate'
+
+
+# Confidence buckets used by handle_group2_input (missing/zero, <30%, <50%, >=50%)
+_BUCKET_NONE, _BUCKET_CRITICAL, _BUCKET_LOW, _BUCKET_OK = range(4)
+
+
+def _confidence_bucket(confidence):
+    """Map a confidence value to the bucket that drives handle_group2_input"""
+    if not confidence:
+        return _BUCKET_NONE
+    if confidence < 0.30:
+        return _BUCKET_CRITICAL
+    if confidence < 0.50:
+        return _BUCKET_LOW
+    return _BUCKET_OK
+
+
+@functools.lru_cache(maxsize=512)
+def _decide(category, bucket):
+    """
+    Confidence-independent part of handle_group2_input's decision
     
-    return routing_decision
+    Returns:
+        tuple: (is_ours, stop, route_items, extra_items)
+        - route_items: (key, value) pairs of the base decision
+          ('confidence' is a placeholder filled in by the caller)
+        - extra_items: (key, value) pairs added after the warnings
+    """
+    
+    # Om's Care Level Logic: Check urgency level first
+    care_level = _CARE_MAP.get(category)
+    
+    # Low priority + Low confidence = Stop execution ("You're fine")
+    if care_level == 'LOW' and bucket in (_BUCKET_CRITICAL, _BUCKET_LOW):
+        stop_items = (
+            ('branch', 'no_care_needed'),
+            ('message', f"Based on your input, you're doing well! The assessment suggests {_CATEGORY_LOWER.get(category) or category.lower()}, which you can explore on your own. No immediate professional support needed."),
+            ('category', category),
+            ('confidence', None),
+            ('action', 'stop_execution'),
+            ('care_level', care_level),
+        )
+        return False, True, stop_items, ()
+    
+    # Process normal routing based on category
+    route = _route_stripped_category(category, None)
+    
+    extra_items = (('care_level', care_level),)
+    if bucket == _BUCKET_CRITICAL:
+        extra_items += (('confidence_warning', 'CRITICAL'), ('requires_manual_review', True))
+    elif bucket == _BUCKET_LOW:
+        extra_items += (('confidence_warning', 'LOW'), ('requires_confirmation', True))
+    
+    return route['branch'] == 'group3', False, tuple(route.items()), extra_items
 
 
 def handle_group2_input(group2_output):
@@ -266,48 +353,30 @@ def handle_group2_input(group2_output):
     
     confidence = group2_output.get('confidence', None)
     category = group2_output.get('category', '').strip()
+    bucket = _confidence_bucket(confidence)
     
-    # Om's Care Level Logic: Check urgency level first
-    care_level = None
-    if category in URGENT_CATEGORIES:
-        care_level = 'URGENT'
-    elif category in MODERATE_CATEGORIES:
-        care_level = 'MODERATE'
-    elif category in LOW_PRIORITY_CATEGORIES:
-        care_level = 'LOW'
+    # Category/bucket part is cached; copy it since callers may mutate
+    is_ours, stop, route_items, extra_items = _decide(category, bucket)
+    decision = dict(route_items)
+    decision['confidence'] = confidence
     
-    # Low priority + Low confidence = Stop execution ("You're fine")
-    if care_level == 'LOW' and confidence and confidence < 0.50:
-        decision = {
-            'branch': 'no_care_needed',
-            'message': f"Based on your input, you're doing well! The assessment suggests {category.lower()}, which you can explore on your own. No immediate professional support needed.",
-            'category': category,
-            'confidence': confidence,
-            'action': 'stop_execution',
-            'care_level': care_level
-        }
+    if stop:
         return False, decision  # Stop - person doesn't need care
     
-    # Process normal routing based on category
-    decision = process_group2_output(group2_output)
-    decision['care_level'] = care_level
-    is_ours = (decision['branch'] == 'group3')
+    _add_input_and_warning(decision, group2_output, confidence)
+    decision.update(extra_items)
     
     # Add confidence-based warnings (but don't stop for Group 3 categories)
-    if confidence and confidence < 0.30:
+    if bucket == _BUCKET_CRITICAL:
         # Very low confidence - critical warning
-        decision['confidence_warning'] = 'CRITICAL'
         decision['warning'] = f'⚠️ CRITICAL: Very low confidence ({confidence:.2%}). Manual review strongly recommended before proceeding.'
-        decision['requires_manual_review'] = True
         
         # Override message to show critical warning
-        if care_level != 'URGENT':
+        if decision['care_level'] != 'URGENT':
             decision['message'] += f'\n⚠️⚠️⚠️ CRITICAL WARNING: Confidence only {confidence:.2%}. Consider manual review.'
     
-    elif confidence and confidence < 0.50:
+    elif bucket == _BUCKET_LOW:
         # Low confidence - requires confirmation
-        decision['confidence_warning'] = 'LOW'
-        decision['requires_confirmation'] = True
         decision['message'] += f' [Low confidence ({confidence:.2%}) - please confirm before proceeding]'
     
     return is_ours, decision
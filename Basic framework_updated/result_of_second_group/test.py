@@ -3,9 +3,14 @@
 Random Test File Generator for Group 2 Output
 
 Generates a test.txt file in the same format as Group 2's output.
-Deletes old file and creates new one with random category and confidence.
+Overwrites the old file with a new one with random category and confidence.
+
+Batch mode (many files from one process, no menu):
+    python test.py --mode 7 --count 50 --seed 1 --out-dir batch/
 """
 
+import argparse
+import io
 import random
 import os
 import sys
@@ -24,6 +29,40 @@ OUTPUT_DIR = current_dir
 OUTPUT_FILE = 'test.txt'
 OUTPUT_PATH = OUTPUT_DIR / OUTPUT_FILE
 
+# Shared random generator for all scenario generation (see seed())
+_RNG = random.Random()
+
+# Extra debug output (set TESTGEN_VERBOSE=1 or pass --verbose)
+VERBOSE = bool(os.environ.get("TESTGEN_VERBOSE"))
+
+# Separator lines (built once, reused by every write)
+_SEP70 = "─" * 70
+_EQ70 = "=" * 70
+
+# Interactive menu, written in one call
+_MENU_TEXT = """\
+{rule}
+BASIC MODES:
+  1. Random scenario
+  2. Group 4 category
+  3. Other category
+  4. Interactive (custom category + confidence)
+
+SYSTEMATIC TESTING (Om's Care Level Logic):
+  5. URGENT + HIGH confidence (>80%)
+  6. URGENT + MEDIUM confidence (50-79%)
+  7. URGENT + LOW confidence (<30%)
+
+  8. MODERATE + HIGH confidence (>80%)
+  9. MODERATE + MEDIUM confidence (50-79%)
+ 10. MODERATE + LOW confidence (<30%)
+
+ 11. LOW priority + HIGH confidence (>80%)
+ 12. LOW priority + MEDIUM confidence (50-79%)
+ 13. LOW priority + LOW confidence (<50%) [SHOULD STOP]
+{rule}
+""".format(rule=_EQ70)
+
 # =====================================================
 # All 57 Categories
 # =====================================================
@@ -51,6 +90,27 @@ ALL_CATEGORIES = [
     'IPV support services', 'Military student support', 'Case manager',
 ]
 
+# Precomputed lookups (built once at import)
+ALL_CATEGORIES_TUPLE = tuple(ALL_CATEGORIES)
+
+# (threshold, label) bands, highest first; first band with confidence >= threshold wins
+_CONF_BANDS = (
+    (0.80, "🟢 High confidence"),
+    (0.50, "🟡 Medium confidence"),
+    (float('-inf'), "🔴 Low confidence - consider manual review"),
+)
+
+# Confidence bars for 0..20 blocks (one block per 5%)
+_BAR_TABLE = tuple('█' * i for i in range(21))
+
+# Categories that get a higher random confidence range
+HIGH_CONF_CATEGORIES = frozenset({'Mental health', 'Crisis counseling', 'Counseling'})
+
+# Category -> every other category, for drawing top-3 alternatives
+ALTERNATIVES_BY_CATEGORY = {
+    c: tuple(x for x in ALL_CATEGORIES if x != c) for c in ALL_CATEGORIES
+}
+
 # Sample user inputs
 SAMPLE_INPUTS = {
     'Mental health': "I need affordable therapy for my mental health",
@@ -68,233 +128,370 @@ SCENARIO_NAMES = [
     'SOCIAL_ISOLATION', 'BURNOUT', 'RELATIONSHIP_ISSUES'
 ]
 
-# Import categories from router
-try:
-    p1_dir = root_dir / "p1"
-    if str(p1_dir) not in sys.path:
-        sys.path.insert(0, str(p1_dir))
-    from group2_router import GROUP3_CATEGORIES, GROUP4_CATEGORIES, OTHER_CATEGORIES
-    print("✓ Imported categories from group2_router.py\n")
-except ImportError:
-    print("⚠️  Using local category definitions\n")
-    GROUP3_CATEGORIES = set([c for c in ALL_CATEGORIES[:27]])
-    GROUP4_CATEGORIES = set([c for c in ALL_CATEGORIES[27:33]])
-    OTHER_CATEGORIES = set([c for c in ALL_CATEGORIES[33:]])
+# (GROUP3, GROUP4, OTHER) category sets, loaded on first use
+_CATEGORY_SETS = None
+_CATEGORY_SET_NAMES = ('GROUP3_CATEGORIES', 'GROUP4_CATEGORIES', 'OTHER_CATEGORIES')
+
+def _load_router_categories():
+    """Import category sets from group2_router once (local fallback if unavailable)"""
+    global _CATEGORY_SETS
+    if _CATEGORY_SETS is not None:
+        return _CATEGORY_SETS
+    
+    # Status lines only when run as a script or in verbose mode
+    show_status = __name__ == "__main__" or VERBOSE
+    
+    try:
+        p1_dir = root_dir / "p1"
+        if str(p1_dir) not in sys.path:
+            sys.path.insert(0, str(p1_dir))
+        from group2_router import GROUP3_CATEGORIES, GROUP4_CATEGORIES, OTHER_CATEGORIES
+        if show_status:
+            print("✓ Imported categories from group2_router.py\n")
+    except ImportError:
+        if show_status:
+            print("⚠️  Using local category definitions\n")
+        GROUP3_CATEGORIES = frozenset(ALL_CATEGORIES[:27])
+        GROUP4_CATEGORIES = frozenset(ALL_CATEGORIES[27:33])
+        OTHER_CATEGORIES = frozenset(ALL_CATEGORIES[33:])
+    
+    _CATEGORY_SETS = (GROUP3_CATEGORIES, GROUP4_CATEGORIES, OTHER_CATEGORIES)
+    return _CATEGORY_SETS
+
+def __getattr__(name):
+    """Keep `from test import GROUP3_CATEGORIES` etc. working, importing the router only then"""
+    if name in _CATEGORY_SET_NAMES:
+        return _load_router_categories()[_CATEGORY_SET_NAMES.index(name)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # =====================================================
 # Generator Functions
 # =====================================================
 
-def generate_random_scenario():
-    """Generate a random test scenario"""
-    category = random.choice(ALL_CATEGORIES)
+def seed(value=None):
+    """Seed the generator's random source (for reproducible batches)"""
+    _RNG.seed(value)
+
+def generate_random_scenario(category=None):
+    """Generate a random test scenario (random category unless one is given)"""
+    choice = _RNG.choice
+    uniform = _RNG.uniform
+    
+    if category is None:
+        category = choice(ALL_CATEGORIES_TUPLE)
     
-    if category in ['Mental health', 'Crisis counseling', 'Counseling']:
-        confidence = random.uniform(0.75, 0.98)
+    if category in HIGH_CONF_CATEGORIES:
+        confidence = uniform(0.75, 0.98)
     else:
-        confidence = random.uniform(0.50, 0.90)
+        confidence = uniform(0.50, 0.90)
     
-    scenario_name = random.choice(SCENARIO_NAMES)
+    scenario_name = choice(SCENARIO_NAMES)
     user_input = SAMPLE_INPUTS.get(category, f"Student: I need help with {category.lower()}")
     top_3 = generate_top_3(category, confidence)
-    
-    if confidence >= 0.80:
-        confidence_level = "🟢 High confidence"
-    elif confidence >= 0.50:
-        confidence_level = "🟡 Medium confidence"
-    else:
-        confidence_level = "🔴 Low confidence - consider manual review"
+    confidence_level = _classify_confidence(confidence)
     
     return {
         'scenario_name': scenario_name,
         'category': category,
         'confidence': confidence,
+        'confidence_pct': confidence * 100.0,
         'user_input': user_input,
         'top_3': top_3,
         'confidence_level': confidence_level
     }
 
+def _classify_confidence(confidence):
+    """Return the confidence level label for a confidence value"""
+    for threshold, label in _CONF_BANDS:
+        if confidence >= threshold:
+            return label
+    return _CONF_BANDS[-1][1]
+
 def generate_top_3(primary_category, primary_confidence):
     """Generate top 3 recommendations"""
-    other_categories = [c for c in ALL_CATEGORIES if c != primary_category]
-    alternatives = random.sample(other_categories, min(2, len(other_categories)))
+    # Categories outside the list (typed in interactive mode) have no
+    # entry; every listed category is a valid alternative for them
+    alt_pool = ALTERNATIVES_BY_CATEGORY.get(primary_category, ALL_CATEGORIES_TUPLE)
+    
+    # Two distinct picks without random.sample (pool always has 56+ entries)
+    n = len(alt_pool)
+    i = _RNG.randrange(n)
+    j = _RNG.randrange(n - 1)
+    if j >= i:
+        j += 1
+    alternatives = (alt_pool[i], alt_pool[j])
     
     remaining = 1.0 - primary_confidence
-    conf_2 = remaining * random.uniform(0.3, 0.7)
+    conf_2 = remaining * _RNG.uniform(0.3, 0.7)
     conf_3 = remaining - conf_2
     
     return [
-        {'category': primary_category, 'confidence': primary_confidence},
-        {'category': alternatives[0], 'confidence': conf_2},
-        {'category': alternatives[1] if len(alternatives) > 1 else 'Campus wellness', 'confidence': conf_3}
+        {'category': primary_category, 'confidence': primary_confidence,
+         'confidence_pct': primary_confidence * 100.0},
+        {'category': alternatives[0], 'confidence': conf_2,
+         'confidence_pct': conf_2 * 100.0},
+        {'category': alternatives[1], 'confidence': conf_3,
+         'confidence_pct': conf_3 * 100.0}
     ]
 
 def format_confidence_bar(confidence):
     """Generate visual confidence bar"""
-    bar_length = int(confidence * 20)
-    return '█' * bar_length
+    return _BAR_TABLE[min(20, max(0, int(confidence * 20)))]
 
-def generate_txt_content(scenario):
-    """Generate complete TXT file content"""
-    lines = [
-        "─" * 70,
-        f"Sample #1: SCENARIO 1:  - {scenario['scenario_name']} {scenario['user_input'][:50]}...",
-        "─" * 70,
-        f"🎯 Recommended: {scenario['category']}",
-        f"📊 Confidence: {scenario['confidence']*100:.2f}%",
-        "📋 Top 3 recommendations:"
-    ]
+def write_txt_content(scenario, fh):
+    """Write complete TXT file content to an open text file handle"""
+    fh.write(
+        f"{_SEP70}\n"
+        f"Sample #1: SCENARIO 1:  - {scenario['scenario_name']} {scenario['user_input'][:50]}...\n"
+        f"{_SEP70}\n"
+        f"🎯 Recommended: {scenario['category']}\n"
+        f"📊 Confidence: {scenario['confidence_pct']:.2f}%\n"
+        "📋 Top 3 recommendations:\n"
+    )
     
-    for i, rec in enumerate(scenario['top_3'], 1):
-        bar = format_confidence_bar(rec['confidence'])
-        lines.append(f"   {i}. {rec['category']:<40} {rec['confidence']*100:>5.2f}% {bar}")
+    # top_3 always has exactly 3 entries, written in one call
+    r1, r2, r3 = scenario['top_3']
+    fh.write(
+        f"   1. {r1['category']:<40} {r1['confidence_pct']:>5.2f}% {format_confidence_bar(r1['confidence'])}\n"
+        f"   2. {r2['category']:<40} {r2['confidence_pct']:>5.2f}% {format_confidence_bar(r2['confidence'])}\n"
+        f"   3. {r3['category']:<40} {r3['confidence_pct']:>5.2f}% {format_confidence_bar(r3['confidence'])}\n"
+    )
     
-    lines.extend(["", f"   {scenario['confidence_level']}"])
-    return '\n'.join(lines)
+    # No trailing newline, same as before
+    fh.write(f"\n   {scenario['confidence_level']}")
+
+def generate_txt_content(scenario):
+    """Generate complete TXT file content as a string"""
+    buf = io.StringIO()
+    write_txt_content(scenario, buf)
+    return buf.getvalue()
 
 def generate_test_file(output_path=None, category=None, confidence=None):
     """Generate test.txt file"""
-    if output_path is None:
-        output_path = OUTPUT_PATH
+    # Normalize to a Path once and reuse it below
+    output_path = OUTPUT_PATH if output_path is None else Path(output_path)
     
-    output_dir = Path(output_path).parent
+    output_dir = output_path.parent
     if not output_dir.exists():
         output_dir.mkdir(parents=True)
     
-    if Path(output_path).exists():
-        os.remove(output_path)
-        print(f"✓ Deleted old file: {Path(output_path).name}")
+    # open('w') below truncates any old file, no need to delete it first
+    if VERBOSE and output_path.exists():
+        print(f"✓ Overwriting old file: {output_path.name}")
     
-    scenario = generate_random_scenario()
+    # Build the scenario around the requested category so the top-3
+    # alternatives never repeat it
+    scenario = generate_random_scenario(category or None)
     
-    if category:
-        scenario['category'] = category
-        scenario['top_3'][0]['category'] = category
     if confidence:
         scenario['confidence'] = confidence
+        scenario['confidence_pct'] = confidence * 100.0
         scenario['top_3'][0]['confidence'] = confidence
+        scenario['top_3'][0]['confidence_pct'] = confidence * 100.0
         # Update confidence level
-        if confidence >= 0.80:
-            scenario['confidence_level'] = "🟢 High confidence"
-        elif confidence >= 0.50:
-            scenario['confidence_level'] = "🟡 Medium confidence"
-        else:
-            scenario['confidence_level'] = "🔴 Low confidence - consider manual review"
-    
-    content = generate_txt_content(scenario)
+        scenario['confidence_level'] = _classify_confidence(confidence)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    with open(output_path, 'w', encoding='utf-8', buffering=8192) as f:
+        write_txt_content(scenario, f)
     
-    print(f"✓ Generated: {Path(output_path).name}")
-    print(f"\n{'='*70}")
+    print(f"✓ Generated: {output_path.name}")
+    print(f"\n{_EQ70}")
     print(f"Scenario: {scenario['scenario_name']}")
     print(f"Category: {scenario['category']}")
     print(f"Confidence: {scenario['confidence']:.2%}")
-    print(f"{'='*70}\n")
+    print(f"{_EQ70}\n")
     
     return scenario
 
 # =====================================================
-# Main Program
+# Test Modes and Command Line
 # =====================================================
 
-if __name__ == "__main__":
+def _mode_random(output_path=None):
+    print("\n[Random]")
+    generate_test_file(output_path)
+
+def _mode_group4(output_path=None):
+    print("\n[Group 4]")
+    cats = ['Support group', 'Peer support']
+    generate_test_file(output_path, category=_RNG.choice(cats))
+
+def _mode_other(output_path=None):
+    print("\n[Other]")
+    cats = ['Career services', 'Campus health', 'Academic advising']
+    generate_test_file(output_path, category=_RNG.choice(cats))
+
+def _read_interactive_inputs():
+    """Ask for the custom category and confidence used by mode 4"""
+    cat = input("Category: ").strip()
+    conf = float(input("Confidence (0-1): ").strip())
+    return {'category': cat, 'confidence': conf}
+
+def _mode_interactive(output_path=None, category=None, confidence=None):
+    print("\n[Interactive]")
+    if category is None:
+        inputs = _read_interactive_inputs()
+        category, confidence = inputs['category'], inputs['confidence']
+    generate_test_file(output_path, category=category, confidence=confidence)
+
+# URGENT tests
+def _mode_urgent_high(output_path=None):
+    print("\n[URGENT + HIGH]")
+    generate_test_file(output_path, category='Crisis counseling', confidence=_RNG.uniform(0.80, 0.98))
+    print("✅ Expected: No warnings")
+
+def _mode_urgent_medium(output_path=None):
+    print("\n[URGENT + MEDIUM]")
+    generate_test_file(output_path, category='Crisis counseling', confidence=_RNG.uniform(0.50, 0.79))
+    print("✅ Expected: No warnings (urgent overrides)")
+
+def _mode_urgent_low(output_path=None):
+    print("\n[URGENT + LOW]")
+    generate_test_file(output_path, category='Crisis counseling', confidence=_RNG.uniform(0.10, 0.29))
+    print("⚠️ Expected: CRITICAL warning BUT continue")
+
+# MODERATE tests
+def _mode_moderate_high(output_path=None):
+    print("\n[MODERATE + HIGH]")
+    generate_test_file(output_path, category='Mental health', confidence=_RNG.uniform(0.80, 0.98))
+    print("✅ Expected: No warnings")
+
+def _mode_moderate_medium(output_path=None):
+    print("\n[MODERATE + MEDIUM]")
+    generate_test_file(output_path, category='Mental health', confidence=_RNG.uniform(0.50, 0.79))
+    print("✅ Expected: No warnings")
+
+def _mode_moderate_low(output_path=None):
+    print("\n[MODERATE + LOW]")
+    generate_test_file(output_path, category='Mental health', confidence=_RNG.uniform(0.10, 0.29))
+    print("⚠️⚠️⚠️ Expected: CRITICAL warning BUT continue")
+
+# LOW priority tests
+def _mode_low_high(output_path=None):
+    print("\n[LOW + HIGH]")
+    generate_test_file(output_path, category='Self-care', confidence=_RNG.uniform(0.80, 0.98))
+    print("✅ Expected: Continue (high confidence overrides)")
+
+def _mode_low_medium(output_path=None):
+    print("\n[LOW + MEDIUM]")
+    generate_test_file(output_path, category='Self-help', confidence=_RNG.uniform(0.50, 0.79))
+    print("✅ Expected: Continue")
+
+def _mode_low_low(output_path=None):
+    print("\n[LOW + LOW] - STOP TEST")
+    generate_test_file(output_path, category='Self-care', confidence=_RNG.uniform(0.10, 0.49))
+    print("❌ Expected: STOP - 'You're doing well!'")
+    print("   is_ours = FALSE")
+
+# Menu choice -> mode handler
+_HANDLERS = {
+    '1': _mode_random,
+    '2': _mode_group4,
+    '3': _mode_other,
+    '4': _mode_interactive,
+    '5': _mode_urgent_high,
+    '6': _mode_urgent_medium,
+    '7': _mode_urgent_low,
+    '8': _mode_moderate_high,
+    '9': _mode_moderate_medium,
+    '10': _mode_moderate_low,
+    '11': _mode_low_high,
+    '12': _mode_low_medium,
+    '13': _mode_low_low,
+}
+
+# Menu choice -> prompt for handler inputs, asked once before a batch
+_MODE_INPUTS = {
+    '4': _read_interactive_inputs,
+}
+
+def _run_mode(choice, output_path=None, **mode_args):
+    """
+    Generate one test file for a menu choice
     
-    print("\n" + "="*70)
-    print("RANDOM TEST FILE GENERATOR FOR GROUP 2 OUTPUT")
-    print("="*70)
-    print(f"Output: {OUTPUT_FILE} (in {OUTPUT_DIR.name}/)\n")
+    mode_args are passed on to the handler (see _MODE_INPUTS).
     
-    print("="*70)
-    print("BASIC MODES:")
-    print("  1. Random scenario")
-    print("  2. Group 4 category")
-    print("  3. Other category")
-    print("  4. Interactive (custom category + confidence)")
-    print()
-    print("SYSTEMATIC TESTING (Om's Care Level Logic):")
-    print("  5. URGENT + HIGH confidence (>80%)")
-    print("  6. URGENT + MEDIUM confidence (50-79%)")
-    print("  7. URGENT + LOW confidence (<30%)")
-    print()
-    print("  8. MODERATE + HIGH confidence (>80%)")
-    print("  9. MODERATE + MEDIUM confidence (50-79%)")
-    print(" 10. MODERATE + LOW confidence (<30%)")
-    print()
-    print(" 11. LOW priority + HIGH confidence (>80%)")
-    print(" 12. LOW priority + MEDIUM confidence (50-79%)")
-    print(" 13. LOW priority + LOW confidence (<50%) [SHOULD STOP]")
-    print("="*70)
+    Returns:
+        False if the choice is not a valid mode, True otherwise
+    """
+    handler = _HANDLERS.get(choice)
+    if handler is None:
+        return False
     
-    choice = input("\nSelect (1-13): ").strip()
+    handler(output_path, **mode_args)
+    return True
+
+def _positive_int(value):
+    """argparse type for --count: an integer of at least 1"""
+    count = int(value)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {count}")
+    return count
+
+def _parse_args(argv=None):
+    """Parse command line options for batch generation"""
+    parser = argparse.ArgumentParser(
+        description="Generate random Group 2 output test files."
+    )
+    parser.add_argument('--count', type=_positive_int, default=1,
+                        help="number of files to generate (default: 1)")
+    parser.add_argument('--mode', default=None,
+                        help="menu mode 1-13 (default: ask interactively)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="base random seed; file i uses seed + i")
+    parser.add_argument('--out-dir', default=None,
+                        help=f"output directory (default: {OUTPUT_DIR.name}/)")
+    parser.add_argument('--verbose', action='store_true',
+                        help="print extra debug output")
+    return parser.parse_args(argv)
+
+# =====================================================
+# Main Program
+# =====================================================
+
+if __name__ == "__main__":
     
-    if choice == '1':
-        print("\n[Random]")
-        generate_test_file()
-    elif choice == '2':
-        print("\n[Group 4]")
-        cats = ['Support group', 'Peer support']
-        generate_test_file(category=random.choice(cats))
-    elif choice == '3':
-        print("\n[Other]")
-        cats = ['Career services', 'Campus health', 'Academic advising']
-        generate_test_file(category=random.choice(cats))
-    elif choice == '4':
-        print("\n[Interactive]")
-        cat = input("Category: ").strip()
-        conf = float(input("Confidence (0-1): ").strip())
-        generate_test_file(category=cat, confidence=conf)
+    args = _parse_args()
+    if args.verbose:
+        VERBOSE = True
+    out_dir = Path(args.out_dir) if args.out_dir else OUTPUT_DIR
     
-    # URGENT tests
-    elif choice == '5':
-        print("\n[URGENT + HIGH]")
-        generate_test_file(category='Crisis counseling', confidence=random.uniform(0.80, 0.98))
-        print("✅ Expected: No warnings")
-    elif choice == '6':
-        print("\n[URGENT + MEDIUM]")
-        generate_test_file(category='Crisis counseling', confidence=random.uniform(0.50, 0.79))
-        print("✅ Expected: No warnings (urgent overrides)")
-    elif choice == '7':
-        print("\n[URGENT + LOW]")
-        generate_test_file(category='Crisis counseling', confidence=random.uniform(0.10, 0.29))
-        print("⚠️ Expected: CRITICAL warning BUT continue")
+    print("\n" + _EQ70)
+    print("RANDOM TEST FILE GENERATOR FOR GROUP 2 OUTPUT")
+    print(_EQ70)
+    if args.count > 1:
+        print(f"Output: test_0000.txt ... test_{args.count - 1:04d}.txt (in {out_dir.name}/)\n")
+    else:
+        print(f"Output: {OUTPUT_FILE} (in {out_dir.name}/)\n")
     
-    # MODERATE tests
-    elif choice == '8':
-        print("\n[MODERATE + HIGH]")
-        generate_test_file(category='Mental health', confidence=random.uniform(0.80, 0.98))
-        print("✅ Expected: No warnings")
-    elif choice == '9':
-        print("\n[MODERATE + MEDIUM]")
-        generate_test_file(category='Mental health', confidence=random.uniform(0.50, 0.79))
-        print("✅ Expected: No warnings")
-    elif choice == '10':
-        print("\n[MODERATE + LOW]")
-        generate_test_file(category='Mental health', confidence=random.uniform(0.10, 0.29))
-        print("⚠️⚠️⚠️ Expected: CRITICAL warning BUT continue")
+    if args.mode is None:
+        # Skip the menu when output is not a terminal (scripted runs)
+        if sys.stdout.isatty():
+            sys.stdout.write(_MENU_TEXT)
+        
+        choice = input("\nSelect (1-13): ").strip()
+    else:
+        choice = args.mode.strip()
     
-    # LOW priority tests
-    elif choice == '11':
-        print("\n[LOW + HIGH]")
-        generate_test_file(category='Self-care', confidence=random.uniform(0.80, 0.98))
-        print("✅ Expected: Continue (high confidence overrides)")
-    elif choice == '12':
-        print("\n[LOW + MEDIUM]")
-        generate_test_file(category='Self-help', confidence=random.uniform(0.50, 0.79))
-        print("✅ Expected: Continue")
-    elif choice == '13':
-        print("\n[LOW + LOW] - STOP TEST")
-        generate_test_file(category='Self-care', confidence=random.uniform(0.10, 0.49))
-        print("❌ Expected: STOP - 'You're doing well!'")
-        print("   is_ours = FALSE")
+    # Ask any mode prompts once, not once per generated file
+    mode_args = _MODE_INPUTS[choice]() if choice in _MODE_INPUTS else {}
     
-    else:
-        print("Invalid selection")
-        exit(1)
+    # Generate all files in this one process
+    for i in range(args.count):
+        if args.seed is not None:
+            seed(args.seed + i)
+        
+        if args.count > 1:
+            output_path = out_dir / f"test_{i:04d}.txt"
+        else:
+            output_path = out_dir / OUTPUT_FILE
+        
+        if not _run_mode(choice, output_path, **mode_args):
+            print("Invalid selection")
+            exit(1)
     
-    print("\n" + "="*70)
-    print("FILE GENERATED!")
-    print("="*70)
+    print("\n" + _EQ70)
+    print(f"{args.count} FILES GENERATED!" if args.count > 1 else "FILE GENERATED!")
+    print(_EQ70)
     print("Run: python main_workflow.py")
-    print("="*70 + "\n")
+    print(_EQ70 + "\n")
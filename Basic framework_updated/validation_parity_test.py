@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Parity test for anti-hallucination validation
+
+Checks validate_results() (batch) and validate_facility() (single) on
+NaN, None, float32 and missing-key inputs:
+- a few hand-written cases with known results
+- random facilities against reference_validation(), a copy of the
+  original per-facility rules (np.mean / np.std on lists, in float64)
+- random facilities, batch against single
+"""
+
+import copy
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add paths for imports
+current_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(current_dir / "integrated"))
+
+from anti_hallucination import AntiHallucinationValidator
+
+nan = float('nan')
+
+SIM_KEYS = [f'{dim}_similarity' for dim in ['affordability', 'crisis_care', 'accessibility',
+                                            'specialization', 'community_integration']]
+DIM_KEYS = [f'{dim}_score' for dim in ['affordability', 'crisis_care', 'accessibility',
+                                       'specialization', 'community_integration']]
+
+BASE = {
+    'name': 'Test Facility',
+    'city': 'Hartford',
+    'state': 'CT',
+    'address': '123 Main St',
+    'phone': '(860) 123-4567',
+    'zip': '06101'
+}
+
+
+def make_facility(**fields):
+    """Complete facility with the given score / similarity fields"""
+    facility = dict(BASE)
+    facility.update(fields)
+    return facility
+
+
+# (facility, expected confidence, expected reliability, expected warnings)
+# Expected values follow the original per-facility rules, reduced in float64
+CASES = [
+    # NaN similarity -> NaN average -> 'low'
+    (make_facility(score=9.0, affordability_similarity=nan), 'low', 64, []),
+    (make_facility(score=9.0, affordability_similarity=0.8, crisis_care_similarity=nan),
+     'low', 64, []),
+    # NaN score with no similarities -> 'low', no score anomaly
+    (make_facility(score=nan), 'low', 64, []),
+    # NaN dimension score -> NaN std dev, no variance warning
+    (make_facility(score=6.0, affordability_score=9.0, crisis_care_score=nan,
+                   accessibility_score=3.0), 'low', 64, []),
+    (make_facility(score=6.0, affordability_score=9.0, crisis_care_score=2.0,
+                   accessibility_score=3.0),
+     'low', 64, ['High score variance (std dev=3.1), may be unreliable']),
+    # float32 similarities are promoted to float64: float32(0.7) is just
+    # under 0.7 -> 'medium' (what the original code gave on NumPy 1.x)
+    (make_facility(score=8.0, affordability_similarity=np.float32(0.7)), 'medium', 82, []),
+    (make_facility(score=8.0, affordability_similarity=np.float32(0.7),
+                   crisis_care_similarity=np.float32(0.7)), 'medium', 82, []),
+    (make_facility(score=8.0, affordability_similarity=np.float32(0.7),
+                   crisis_care_similarity=0.7), 'medium', 82, []),
+    # None similarity is treated as missing -> score-based confidence
+    (make_facility(score=7.2, affordability_similarity=None), 'medium', 82, []),
+    # Missing keys
+    (make_facility(score=7.2), 'medium', 82, []),
+    ({'name': 'Sparse Facility', 'score': 1.5}, 'low', 42,
+     ['Incomplete data (27%)', 'Abnormally low score (1.5/10), may not match criteria']),
+]
+
+
+def reference_validation(facility):
+    """
+    Original per-facility rules, for comparison
+    
+    Same logic as the validator before it was vectorized, except that
+    None counts as missing (the original raised), values are reduced in
+    float64, and required fields reject the same placeholders as optional
+    ones (a deliberate change to the completeness check).
+    
+    Returns:
+        (confidence_level, reliability_score, warnings)
+    """
+    
+    score = facility.get('score', 0)
+    
+    similarities = [float(facility[k]) for k in SIM_KEYS if facility.get(k) is not None]
+    if similarities:
+        avg_similarity = np.mean(similarities)
+        confidence = ('high' if avg_similarity >= 0.70
+                      else 'medium' if avg_similarity >= 0.50 else 'low')
+    else:
+        confidence = 'high' if score >= 8.5 else 'medium' if score >= 7.0 else 'low'
+    
+    def is_complete(field):
+        value = facility.get(field, '')
+        return bool(value) and str(value).strip().lower() not in [
+            'nan', 'address not available', 'phone not available', ''
+        ]
+    
+    complete_required = sum(1 for field in ['name', 'city', 'state'] if is_complete(field))
+    complete_optional = sum(1 for field in ['address', 'phone', 'zip'] if is_complete(field))
+    completeness = (complete_required / 3) * 0.8 + (complete_optional / 3) * 0.2
+    
+    warnings = []
+    if completeness < 0.5:
+        warnings.append(f"Incomplete data ({completeness*100:.0f}%)")
+    if score >= 9.5:
+        warnings.append(f"Abnormally high score ({score:.1f}/10), manual verification recommended")
+    if score <= 2.0:
+        warnings.append(f"Abnormally low score ({score:.1f}/10), may not match criteria")
+    dimension_scores = [float(facility[k]) for k in DIM_KEYS if facility.get(k) is not None]
+    if dimension_scores:
+        std_dev = np.std(dimension_scores)
+        if std_dev > 2.0:
+            warnings.append(f"High score variance (std dev={std_dev:.1f}), may be unreliable")
+    
+    weight = {'high': 1.0, 'medium': 0.7, 'low': 0.4}[confidence]
+    reliability = min(100, max(0, (weight * 0.6 + completeness * 0.3 + 0.1) * 100))
+    
+    return confidence, reliability, warnings
+
+
+def random_facilities(count, seed=0):
+    """Mixed float / float32 / NaN / None / missing inputs"""
+    rng = np.random.default_rng(seed)
+    facilities = []
+    for _ in range(count):
+        fields = {'score': float(rng.uniform(0, 10))}
+        # Some incomplete contact data, so completeness varies too
+        for key in ['city', 'state', 'address', 'phone', 'zip']:
+            r = rng.random()
+            if r < 0.1:
+                fields[key] = ''
+            elif r < 0.15:
+                fields[key] = 'nan'
+            elif r < 0.2:
+                fields[key] = 'Phone not available'
+        for dim in ['affordability', 'crisis_care', 'accessibility',
+                    'specialization', 'community_integration']:
+            for key, low, high in ((f'{dim}_similarity', 0.2, 0.9),
+                                   (f'{dim}_score', 0.0, 10.0)):
+                r = rng.random()
+                if r < 0.15:
+                    continue
+                elif r < 0.25:
+                    fields[key] = None
+                elif r < 0.30:
+                    fields[key] = nan
+                elif r < 0.65:
+                    fields[key] = np.float32(rng.uniform(low, high))
+                else:
+                    fields[key] = float(rng.uniform(low, high))
+        facilities.append(make_facility(**fields))
+    return facilities
+
+
+def test_expected_values():
+    validator = AntiHallucinationValidator()
+    for facility, confidence, reliability, warnings in CASES:
+        single = validator.validate_facility(copy.deepcopy(facility))['validation']
+        assert single.confidence_level == confidence, (facility, single)
+        assert round(single.reliability_score) == reliability, (facility, single)
+        assert single.warnings == warnings, (facility, single)
+
+
+def test_matches_reference():
+    validator = AntiHallucinationValidator()
+    facilities = random_facilities(2000, seed=1)
+    
+    batch = validator.validate_results(copy.deepcopy(facilities))
+    for facility, batch_facility in zip(facilities, batch):
+        expected = reference_validation(facility)
+        single = validator.validate_facility(copy.deepcopy(facility))['validation']
+        for validation in (single, batch_facility['validation']):
+            actual = (validation.confidence_level, validation.reliability_score,
+                      validation.warnings)
+            assert actual == expected, (facility, actual, expected)
+
+
+def test_batch_matches_single():
+    validator = AntiHallucinationValidator()
+    facilities = [case[0] for case in CASES] + random_facilities(500)
+
+    batch = validator.validate_results(copy.deepcopy(facilities))
+    for facility, batch_facility in zip(facilities, batch):
+        single = validator.validate_facility(copy.deepcopy(facility))
+        assert single['validation'] == batch_facility['validation'], facility
+
+
+if __name__ == "__main__":
+    test_expected_values()
+    test_matches_reference()
+    test_batch_matches_single()
+    print("✅ Batch and single-facility validation match the reference rules")